@@ -79,6 +79,13 @@ def escape_control_characters(text: str, keep_spacing=True) -> str:
     return text.translate(trans)
 
 
+# Bytes that repr() leaves untouched and that are never escaped: printable ASCII
+# except the backslash and the single quote.
+_UNESCAPED_BYTES = bytes(
+    i for i in range(0x20, 0x7f) if i not in b"\\'"
+)
+
+
 def bytes_to_escaped_str(data, keep_spacing=False, escape_single_quotes=False):
     """
     Take bytes and return a safe string that can be displayed to the user.
@@ -93,6 +100,9 @@ def bytes_to_escaped_str(data, keep_spacing=False, escape_single_quotes=False):
 
     if not isinstance(data, bytes):
         raise ValueError("data must be bytes, but is {}".format(data.__class__.__name__))
+    if not data.translate(None, _UNESCAPED_BYTES):
+        # Fast path: nothing to escape.
+        return data.decode("ascii")
     # We always insert a double-quote here so that we get a single-quoted string back
     # https://stackoverflow.com/questions/29019340/why-does-python-use-different-quotes-for-representing-strings-depending-on-their
     ret = repr(b'"' + data).lstrip("b")[2:-1]
@@ -116,6 +126,9 @@ def escaped_str_to_bytes(data):
     """
     if not isinstance(data, str):
         raise ValueError("data must be str, but is {}".format(data.__class__.__name__))
+    if "\\" not in data:
+        # Fast path: no escape sequences to decode.
+        return data.encode()
 
     # This one is difficult - we use an undocumented Python API here
     # as per http://stackoverflow.com/a/23151714/934719
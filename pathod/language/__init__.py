@@ -1,9 +1,11 @@
+import functools
 import itertools
+import sys
 import time
 
 import pyparsing as pp
 
-from . import http, http2, websockets, writer, exceptions
+from . import http, http2, websockets, writer, exceptions, message
 
 from .exceptions import RenderError, FileAccessDenied, ParseException
 from .base import Settings
@@ -17,72 +19,111 @@ __all__ = [
 def expand(msg):
     times = getattr(msg, "times", None)
     if times:
-        for j_ in range(int(times.value)):
+        for j_ in range(times.int_value):
             yield msg.strike_token("times")
     else:
         yield msg
 
 
-def parse_pathod(s, use_http2=False):
+def _check_ascii(s):
     """
         May raise ParseException
     """
-    try:
-        s.encode("ascii")
-    except UnicodeError:
+    if sys.version_info >= (3, 7):
+        # str.isascii reads a flag CPython already keeps on the string,
+        # rather than encoding a copy of it.
+        ok = s.isascii()
+    else:  # pragma: no cover
+        try:
+            s.encode("ascii")
+            ok = True
+        except UnicodeError:
+            ok = False
+    if not ok:
         raise exceptions.ParseException("Spec must be valid ASCII.", 0, 0)
+
+
+def _parse(grammar, s):
+    """
+        Parse s with grammar, translating pyparsing errors.
+
+        May raise ParseException
+    """
     try:
-        if use_http2:
-            expressions = [
-                # http2.Frame.expr(),
-                http2.Response.expr(),
-            ]
-        else:
-            expressions = [
-                websockets.WebsocketFrame.expr(),
-                http.Response.expr(),
-            ]
-        reqs = pp.Or(expressions).parseString(s, parseAll=True)
+        return grammar.parseString(s, parseAll=True)
     except pp.ParseException as v:
-        raise exceptions.ParseException(v.msg, v.line, v.col)
+        raise exceptions.ParseException(v.msg, v.line, v.col) from None
+
+
+@functools.lru_cache()
+def _pathod_grammar(use_http2):
+    if use_http2:
+        expressions = [
+            # http2.Frame.expr(),
+            message.grammar(http2.Response),
+        ]
+    else:
+        expressions = [
+            message.grammar(websockets.WebsocketFrame),
+            message.grammar(http.Response),
+        ]
+    # Websocket frames start with "wf", which no HTTP message can, so at most
+    # one alternative can match and the first match can be taken. pp.Or
+    # would try every alternative to find the longest.
+    return pp.MatchFirst(expressions)
+
+
+@functools.lru_cache()
+def _pathoc_grammar(use_http2):
+    if use_http2:
+        expressions = [
+            # http2.Frame.expr(),
+            message.grammar(http2.Request),
+        ]
+    else:
+        expressions = [
+            message.grammar(websockets.WebsocketClientFrame),
+            message.grammar(http.Request),
+        ]
+    # As in _pathod_grammar, the alternatives can't match the same input.
+    return pp.OneOrMore(pp.MatchFirst(expressions))
+
+
+@functools.lru_cache()
+def _websocket_frame_grammar():
+    return pp.OneOrMore(message.grammar(websockets.WebsocketFrame))
+
+
+def parse_pathod(s, use_http2=False):
+    """
+        May raise ParseException
+    """
+    _check_ascii(s)
+    reqs = _parse(_pathod_grammar(use_http2), s)
     return itertools.chain(*[expand(i) for i in reqs])
 
 
 def parse_pathoc(s, use_http2=False):
-    try:
-        s.encode("ascii")
-    except UnicodeError:
-        raise exceptions.ParseException("Spec must be valid ASCII.", 0, 0)
-    try:
-        if use_http2:
-            expressions = [
-                # http2.Frame.expr(),
-                http2.Request.expr(),
-            ]
-        else:
-            expressions = [
-                websockets.WebsocketClientFrame.expr(),
-                http.Request.expr(),
-            ]
-        reqs = pp.OneOrMore(pp.Or(expressions)).parseString(s, parseAll=True)
-    except pp.ParseException as v:
-        raise exceptions.ParseException(v.msg, v.line, v.col)
+    _check_ascii(s)
+    reqs = _parse(_pathoc_grammar(use_http2), s)
     return itertools.chain(*[expand(i) for i in reqs])
 
 
+def parse_pathoc_many(specs, use_http2=False):
+    """
+        Parse several pathoc specs, returning a list with the requests of
+        each, as parse_pathoc would.
+
+        May raise ParseException
+    """
+    return [parse_pathoc(s, use_http2) for s in specs]
+
+
 def parse_websocket_frame(s):
     """
         May raise ParseException
     """
-    try:
-        reqs = pp.OneOrMore(
-            websockets.WebsocketFrame.expr()
-        ).parseString(
-            s,
-            parseAll=True
-        )
-    except pp.ParseException as v:
-        raise exceptions.ParseException(v.msg, v.line, v.col)
+    reqs = _parse(_websocket_frame_grammar(), s)
     return itertools.chain(*[expand(i) for i in reqs])
 
 
@@ -99,14 +140,10 @@ def serve(msg, fp, settings):
     msg = msg.resolve(settings)
     started = time.time()
 
-    vals = msg.values(settings)
-    vals.reverse()
-
-    actions = sorted(msg.actions[:])
-    actions.reverse()
-    actions = [i.intermediate(settings) for i in actions]
+    vals = writer.coalesce_values(msg.values(settings))
+    actions = [i.intermediate(settings) for i in sorted(msg.actions)]
 
-    disconnect = writer.write_values(fp, vals, actions[:])
+    disconnect = writer.write_values(fp, vals, actions)
     duration = time.time() - started
     ret = dict(
         disconnect=disconnect,
@@ -1,5 +1,3 @@
-import abc
-import copy
 import random
 from functools import total_ordering
 import pyparsing as pp
@@ -14,6 +12,7 @@ class _Action(base.Token):
         actions have one thing in common: an offset that specifies where the
         action should take place.
     """
+    __slots__ = ("offset",)
 
     def __init__(self, offset):
         self.offset = offset
@@ -21,15 +20,13 @@ class _Action(base.Token):
     def resolve(self, settings, msg):
         """
             Resolves offset specifications to a numeric offset. Returns a copy
-            of the action object.
+            of the action object if the offset had to be resolved.
         """
-        c = copy.copy(self)
-        l = msg.length(settings)
-        if c.offset == "r":
-            c.offset = random.randrange(l)
-        elif c.offset == "a":
-            c.offset = l + 1
-        return c
+        if self.offset == "r":
+            return self._clone(random.randrange(msg.length(settings)))
+        elif self.offset == "a":
+            return self._clone(msg.length(settings) + 1)
+        return self
 
     def __lt__(self, other):
         return self.offset < other.offset
@@ -40,16 +37,21 @@ class _Action(base.Token):
     def __repr__(self):
         return self.spec()
 
-    @abc.abstractmethod
     def spec(self):  # pragma: no cover
-        pass
+        raise NotImplementedError
+
+    def _clone(self, offset):  # pragma: no cover
+        """
+            Return a copy of this action at a different offset.
+        """
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def intermediate(self, settings):  # pragma: no cover
-        pass
+        raise NotImplementedError
 
 
 class PauseAt(_Action):
+    __slots__ = ("seconds",)
     unique_name = None
 
     def __init__(self, offset, seconds):
@@ -75,11 +77,15 @@ class PauseAt(_Action):
     def intermediate(self, settings):
         return (self.offset, "pause", self.seconds)
 
+    def _clone(self, offset):
+        return PauseAt(offset, self.seconds)
+
     def freeze(self, settings_):
         return self
 
 
 class DisconnectAt(_Action):
+    __slots__ = ()
 
     def __init__(self, offset):
         _Action.__init__(self, offset)
@@ -96,11 +102,15 @@ class DisconnectAt(_Action):
     def intermediate(self, settings):
         return (self.offset, "disconnect")
 
+    def _clone(self, offset):
+        return DisconnectAt(offset)
+
     def freeze(self, settings_):
         return self
 
 
 class InjectAt(_Action):
+    __slots__ = ("value",)
     unique_name = None  # type: ignore
 
     def __init__(self, offset, value):
@@ -125,5 +135,8 @@ class InjectAt(_Action):
             self.value.get_generator(settings)
         )
 
+    def _clone(self, offset):
+        return InjectAt(offset, self.value)
+
     def freeze(self, settings):
         return InjectAt(self.offset, self.value.freeze(settings))
@@ -1,7 +1,5 @@
-import operator
-import os
-import abc
 import functools
+import os
 import pyparsing as pp
 from mitmproxy.utils import strutils
 from mitmproxy.utils import human
@@ -11,6 +9,14 @@ from . import exceptions
 
 
 class Settings:
+    __slots__ = (
+        "is_client",
+        "staticdir",
+        "unconstrained_file_access",
+        "request_host",
+        "websocket_key",
+        "protocol",
+    )
 
     def __init__(
         self,
@@ -60,6 +66,12 @@ v_naked_literal = pp.MatchFirst(
 )
 
 
+v_size_unit = pp.oneOf(list(human.SIZE_UNITS.keys())).leaveWhitespace()
+
+
+v_datatype = pp.oneOf(list(generators.DATATYPES.keys()))
+
+
 class Token:
 
     """
@@ -67,7 +79,7 @@ class Token:
         classes have no meaning in and of themselves, and are combined into
         Components and Actions to build the language.
     """
-    __metaclass__ = abc.ABCMeta
+    __slots__ = ()
 
     @classmethod
     def expr(cls):  # pragma: no cover
@@ -76,12 +88,11 @@ class Token:
         """
         return None
 
-    @abc.abstractmethod
     def spec(self):  # pragma: no cover
         """
             A parseable specification for this token.
         """
-        return None
+        raise NotImplementedError
 
     @property
     def unique_name(self) -> typing.Optional[str]:
@@ -107,9 +118,11 @@ class Token:
 
 
 class _TokValueLiteral(Token):
+    __slots__ = ("val", "_spec")
 
     def __init__(self, val):
         self.val = strutils.escaped_str_to_bytes(val)
+        self._spec = None
 
     def get_generator(self, settings_):
         return self.val
@@ -117,12 +130,22 @@ class _TokValueLiteral(Token):
     def freeze(self, settings_):
         return self
 
+    def spec(self):
+        # Tokens are immutable, so the escaped form only needs computing once.
+        if self._spec is None:
+            self._spec = self._escaped_spec()
+        return self._spec
 
-class TokValueLiteral(_TokValueLiteral):
+    def _escaped_spec(self):  # pragma: no cover
+        raise NotImplementedError
 
+
+class TokValueLiteral(_TokValueLiteral):
     """
         A literal with Python-style string escaping
     """
+    __slots__ = ()
+
     @classmethod
     def expr(cls):
         e = v_literal.copy()
@@ -133,35 +156,42 @@ class TokValueLiteral(_TokValueLiteral):
         v = cls(*x)
         return v
 
-    def spec(self):
+    def _escaped_spec(self):
         inner = strutils.bytes_to_escaped_str(self.val)
         inner = inner.replace(r"'", r"\x27")
         return "'" + inner + "'"
 
 
 class TokValueNakedLiteral(_TokValueLiteral):
+    __slots__ = ()
 
     @classmethod
     def expr(cls):
         e = v_naked_literal.copy()
         return e.setParseAction(lambda x: cls(*x))
 
-    def spec(self):
+    def _escaped_spec(self):
         return strutils.bytes_to_escaped_str(self.val, escape_single_quotes=True)
 
 
 class TokValueGenerate(Token):
+    __slots__ = ("usize", "unit", "datatype", "_generator")
 
     def __init__(self, usize, unit, datatype):
         if not unit:
             unit = "b"
         self.usize, self.unit, self.datatype = usize, unit, datatype
+        self._generator = None
 
     def bytes(self):
         return self.usize * human.SIZE_UNITS[self.unit]
 
     def get_generator(self, settings_):
-        return generators.RandomGenerator(self.datatype, self.bytes())
+        # RandomGenerator holds no state beyond its datatype and length, so
+        # one instance can be handed out every time.
+        if self._generator is None:
+            self._generator = generators.RandomGenerator(self.datatype, self.bytes())
+        return self._generator
 
     def freeze(self, settings):
         g = self.get_generator(settings)
@@ -171,17 +201,10 @@ class TokValueGenerate(Token):
     def expr(cls):
         e = pp.Literal("@").suppress() + v_integer
 
-        u = functools.reduce(
-            operator.or_,
-            [pp.Literal(i) for i in human.SIZE_UNITS.keys()]
-        ).leaveWhitespace()
-        e = e + pp.Optional(u, default=None)
+        e = e + pp.Optional(v_size_unit, default=None)
 
         s = pp.Literal(",").suppress()
-        s += functools.reduce(
-            operator.or_,
-            [pp.Literal(i) for i in generators.DATATYPES.keys()]
-        )
+        s += v_datatype
         e += pp.Optional(s, default="bytes")
         return e.setParseAction(lambda x: cls(*x))
 
@@ -194,10 +217,48 @@ class TokValueGenerate(Token):
         return s
 
 
+# The static directory is fixed for the lifetime of a daemon, so there's no
+# need to normalize it again for every file access.
+_normpath = functools.lru_cache(maxsize=16)(os.path.normpath)
+
+
+def _abs_staticdir(staticdir):
+    """
+        The absolute, normalized form of staticdir. Only absolute directories
+        are cached, since a relative one depends on the working directory.
+    """
+    if os.path.isabs(staticdir):
+        return _normpath(staticdir)
+    return os.path.abspath(staticdir)
+
+
+def _is_within(path, directory):
+    """
+        Is path inside directory? Both must be absolute and normalized.
+    """
+    try:
+        return os.path.commonpath([path, directory]) == directory
+    except ValueError:  # pragma: no cover
+        # Paths on different drives.
+        return False
+
+
 class TokValueFile(Token):
+    __slots__ = ("path", "_relpath")
 
     def __init__(self, path):
         self.path = str(path)
+        # The path is fixed, so expand and normalize it once. A normalized
+        # relative path that doesn't start with .. can't leave the directory
+        # it is joined to.
+        p = os.path.normpath(os.path.expanduser(self.path))
+        if (
+            os.path.isabs(p) or os.path.splitdrive(p)[0] or
+            p == os.pardir or p.startswith(os.pardir + os.sep)
+        ):
+            self._relpath = None
+        else:
+            self._relpath = p
 
     @classmethod
     def expr(cls):
@@ -211,15 +272,19 @@ class TokValueFile(Token):
     def get_generator(self, settings):
         if not settings.staticdir:
             raise exceptions.FileAccessDenied("File access disabled.")
-        s = os.path.expanduser(self.path)
-        s = os.path.normpath(
-            os.path.abspath(os.path.join(settings.staticdir, s))
-        )
-        uf = settings.unconstrained_file_access
-        if not uf and not s.startswith(os.path.normpath(settings.staticdir)):
-            raise exceptions.FileAccessDenied(
-                "File access outside of configured directory"
+        sd = _abs_staticdir(settings.staticdir)
+        if self._relpath:
+            s = os.path.join(sd, self._relpath)
+        else:
+            # abspath() already normalizes the joined path.
+            s = os.path.abspath(
+                os.path.join(sd, os.path.expanduser(self.path))
             )
+            uf = settings.unconstrained_file_access
+            if not uf and not _is_within(s, sd):
+                raise exceptions.FileAccessDenied(
+                    "File access outside of configured directory"
+                )
         if not os.path.isfile(s):
             raise exceptions.FileAccessDenied("File not readable")
         return generators.FileGenerator(s)
@@ -262,6 +327,7 @@ class _Component(Token):
         A value component of the primary specification of an message.
         Components produce byte values describing the bytes of the message.
     """
+    __slots__ = ()
 
     def values(self, settings):  # pragma: no cover
         """
@@ -282,6 +348,7 @@ class KeyValue(_Component):
         A key/value pair.
         cls.preamble: leader
     """
+    __slots__ = ("key", "value")
 
     def __init__(self, key, value):
         self.key, self.value = key, value
@@ -308,6 +375,7 @@ class CaselessLiteral(_Component):
     """
         A caseless token that can take only one value.
     """
+    __slots__ = ("value",)
 
     def __init__(self, value):
         self.value = value
@@ -333,6 +401,7 @@ class OptionsOrValue(_Component):
     """
         Can be any of a specified set of options, or a value specifier.
     """
+    __slots__ = ("option_used", "value")
     preamble = ""
     options: typing.List[str] = []
 
@@ -376,6 +445,7 @@ class OptionsOrValue(_Component):
 
 
 class Integer(_Component):
+    __slots__ = ("int_value", "value")
     bounds: typing.Tuple[typing.Optional[int], typing.Optional[int]] = (None, None)
     preamble = ""
 
@@ -390,6 +460,7 @@ class Integer(_Component):
                 "Integer value must be between %s and %s." % self.bounds,
                 0, 0
             )
+        self.int_value = v
         self.value = str(value).encode()
 
     @classmethod
@@ -414,6 +485,7 @@ class Value(_Component):
     """
         A value component lead by an optional preamble.
     """
+    __slots__ = ("value",)
     preamble = ""
 
     def __init__(self, value):
@@ -441,6 +513,7 @@ class FixedLengthValue(Value):
     """
         A value component lead by an optional preamble.
     """
+    __slots__ = ()
     preamble = ""
     length: typing.Optional[int] = None
 
@@ -484,6 +557,7 @@ class Boolean(_Component):
             name  = true
             -name = false
     """
+    __slots__ = ("value",)
     name = ""
 
     def __init__(self, value):
@@ -511,6 +585,7 @@ class IntField(_Component):
     """
         An integer field, where values can optionally specified by name.
     """
+    __slots__ = ("origvalue", "value")
     names: typing.Dict[str, int] = {}
     max = 16
     preamble = ""
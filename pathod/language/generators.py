@@ -1,3 +1,4 @@
+import functools
 import os
 import string
 import random
@@ -18,7 +19,23 @@ DATATYPES = dict(
 )
 
 
-class TransformGenerator:
+class Generator:
+
+    """
+        Base class for lazily-rendered values.
+    """
+    __slots__ = ()
+
+    def stream(self, start, end, blocksize):
+        """
+            Yield the bytes in (start, end) in chunks of at most blocksize,
+            without rendering the whole range up front.
+        """
+        for i in range(start, end, blocksize):
+            yield self[i:min(i + blocksize, end)]
+
+
+class TransformGenerator(Generator):
 
     """
         Perform a byte-by-byte transform another generator - that is, for each
@@ -27,6 +44,7 @@ class TransformGenerator:
         gen: A generator to wrap
         transform: A function (offset, data) -> transformed
     """
+    __slots__ = ("gen", "transform")
 
     def __init__(self, gen, transform):
         self.gen = gen
@@ -54,7 +72,38 @@ def rand_byte(chars):
     return bytes([random.choice(chars)])
 
 
-class RandomGenerator:
+@functools.lru_cache(maxsize=32)
+def _urandom_table(chars):
+    """
+        Return a (table, delete) pair for bytes.translate that maps uniformly
+        distributed random bytes onto chars. Bytes at or above the largest
+        multiple of len(chars) are deleted rather than mapped, so that every
+        character is equally likely.
+    """
+    keep = 256 - 256 % len(chars)
+    table = (chars * (256 // len(chars) + 1))[:256]
+    return table, bytes(range(keep, 256))
+
+
+def rand_bytes(chars, n):
+    """
+        Return n random characters as bytes from a charset, drawn in a single
+        batch rather than one byte at a time.
+    """
+    if len(chars) == 256:
+        return os.urandom(n)
+    table = _urandom_table(chars)
+    ret = b""
+    while len(ret) < n:
+        # Over-draw by the expected rejection rate, plus a little slack.
+        want = n - len(ret)
+        want = want * 256 // (256 - len(table[1])) + 16
+        ret += os.urandom(want).translate(*table)
+    return ret[:n]
+
+
+class RandomGenerator(Generator):
+    __slots__ = ("dtype", "length")
 
     def __init__(self, dtype, length):
         self.dtype = dtype
@@ -66,14 +115,27 @@ class RandomGenerator:
     def __getitem__(self, x):
         chars = DATATYPES[self.dtype]
         if isinstance(x, slice):
-            return b"".join(rand_byte(chars) for _ in range(*x.indices(min(self.length, sys.maxsize))))
+            n = len(range(*x.indices(min(self.length, sys.maxsize))))
+            return rand_bytes(chars, n)
         return rand_byte(chars)
 
+    def stream(self, start, end, blocksize):
+        chars = DATATYPES[self.dtype]
+        end = min(end, self.length)
+        for i in range(start, end, blocksize):
+            yield rand_bytes(chars, min(blocksize, end - i))
+
     def __repr__(self):
         return "%s random from %s" % (self.length, self.dtype)
 
 
-class FileGenerator:
+# Slices of a file up to this size are read directly rather than through mmap.
+MMAP_THRESHOLD = 16 * 1024
+
+
+class FileGenerator(Generator):
+    __slots__ = ("path",)
+
     def __init__(self, path):
         self.path = os.path.expanduser(path)
 
@@ -83,11 +145,36 @@ class FileGenerator:
     def __getitem__(self, x):
         with open(self.path, mode="rb") as f:
             if isinstance(x, slice):
+                start, stop, step = x.indices(os.fstat(f.fileno()).st_size)
+                if step == 1 and stop - start <= MMAP_THRESHOLD:
+                    # Small contiguous reads, such as the truncated values
+                    # in logs, don't need the whole file mapped.
+                    f.seek(start)
+                    return f.read(max(stop - start, 0))
                 with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
                     return mapped.__getitem__(x)
             else:
                 f.seek(x)
                 return f.read(1)
 
+    def stream(self, start, end, blocksize):
+        # Read sequentially from a single open file, rather than opening and
+        # mapping the file again for every block. Blocks are read at exactly
+        # the size they are written, so Python's own read buffer would only
+        # add a copy.
+        with open(self.path, mode="rb", buffering=0) as f:
+            if end > start and hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(
+                    f.fileno(), start, end - start, os.POSIX_FADV_SEQUENTIAL
+                )
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                d = f.read(min(blocksize, remaining))
+                if not d:
+                    break
+                remaining -= len(d)
+                yield d
+
     def __repr__(self):
         return "<%s" % self.path
@@ -1,4 +1,5 @@
 import abc
+import functools
 
 import pyparsing as pp
 
@@ -11,35 +12,47 @@ from . import base, exceptions, actions, message
 # see http2 language for an example
 
 
+REASONS = {
+    code: reason.encode()
+    for code, reason in status_codes.RESPONSES.items()
+}
+
+
 class WS(base.CaselessLiteral):
+    __slots__ = ()
     TOK = "ws"
 
 
 class Raw(base.CaselessLiteral):
+    __slots__ = ()
     TOK = "r"
 
 
 class Path(base.Value):
-    pass
+    __slots__ = ()
 
 
 class StatusCode(base.Integer):
-    pass
+    __slots__ = ()
 
 
 class Reason(base.Value):
+    __slots__ = ()
     preamble = "m"
 
 
 class Body(base.Value):
+    __slots__ = ()
     preamble = "b"
 
 
 class Times(base.Integer):
+    __slots__ = ()
     preamble = "x"
 
 
 class Method(base.OptionsOrValue):
+    __slots__ = ()
     options = [
         "GET",
         "HEAD",
@@ -53,6 +66,8 @@ class Method(base.OptionsOrValue):
 
 
 class _HeaderMixin:
+    __slots__ = ()
+
     @property
     def unique_name(self):
         return None
@@ -68,20 +83,24 @@ class _HeaderMixin:
 
 
 class Header(_HeaderMixin, base.KeyValue):
+    __slots__ = ()
     preamble = "h"
 
 
 class ShortcutContentType(_HeaderMixin, base.Value):
+    __slots__ = ()
     preamble = "c"
     key = base.TokValueLiteral("Content-Type")
 
 
 class ShortcutLocation(_HeaderMixin, base.Value):
+    __slots__ = ()
     preamble = "l"
     key = base.TokValueLiteral("Location")
 
 
 class ShortcutUserAgent(_HeaderMixin, base.OptionsOrValue):
+    __slots__ = ()
     preamble = "u"
     options = [i[1] for i in user_agents.UASTRINGS]
     key = base.TokValueLiteral("User-Agent")
@@ -109,6 +128,22 @@ def get_header(val, headers):
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def server_handshake_tokens(websocket_key):
+    """
+        Header tokens for the server side of a websocket handshake. These only
+        depend on the client's key, and tokens are immutable, so they can be
+        shared between responses.
+    """
+    return tuple(
+        Header(
+            base.TokValueLiteral(k.decode()),
+            base.TokValueLiteral(v.decode())
+        )
+        for k, v in websocket.server_handshake_headers(websocket_key).fields
+    )
+
+
 class _HTTPMessage(message.Message):
     version = b"HTTP/1.1"
 
@@ -174,16 +209,12 @@ class Response(_HTTPMessage):
     def preamble(self, settings):
         l = [self.version, b" "]
         l.extend(self.status_code.values(settings))
-        status_code = int(self.status_code.value)
         l.append(b" ")
         if self.reason:
             l.extend(self.reason.values(settings))
         else:
             l.append(
-                status_codes.RESPONSES.get(
-                    status_code,
-                    "Unknown code"
-                ).encode()
+                REASONS.get(self.status_code.int_value, b"Unknown code")
             )
         return l
 
@@ -199,16 +230,9 @@ class Response(_HTTPMessage):
                     1,
                     StatusCode(101)
                 )
-            headers = websocket.server_handshake_headers(
-                settings.websocket_key
-            )
-            for i in headers.fields:
-                if not get_header(i[0], self.headers):
-                    tokens.append(
-                        Header(
-                            base.TokValueLiteral(i[0].decode()),
-                            base.TokValueLiteral(i[1].decode()))
-                    )
+            for h in server_handshake_tokens(settings.websocket_key):
+                if not get_header(h.key.val, self.headers):
+                    tokens.append(h)
         if not self.raw:
             if not get_header(b"Content-Length", self.headers):
                 if not self.body:
@@ -253,6 +277,7 @@ class Response(_HTTPMessage):
 
 
 class NestedResponse(message.NestedMessage):
+    __slots__ = ()
     preamble = "s"
     nest_type = Response
 
@@ -380,14 +405,25 @@ class Request(_HTTPMessage):
         return ":".join([i.spec() for i in self.tokens])
 
 
+_ERROR_STATUS_CODE = StatusCode("800")
+_ERROR_CONTENT_TYPE = Header(
+    base.TokValueLiteral("Content-Type"),
+    base.TokValueLiteral("text/plain")
+)
+
+
+@functools.lru_cache(maxsize=64)
 def make_error_response(reason, body=None):
+    """
+        Error responses are fully built here and not modified afterwards, so
+        identical errors share one.
+    """
     tokens = [
-        StatusCode("800"),
-        Header(
-            base.TokValueLiteral("Content-Type"),
-            base.TokValueLiteral("text/plain")
-        ),
+        _ERROR_STATUS_CODE,
+        _ERROR_CONTENT_TYPE,
         Reason(base.TokValueLiteral(reason)),
         Body(base.TokValueLiteral("pathod error: " + (body or reason))),
     ]
-    return Response(tokens)
+    resp = Response(tokens)
+    resp.is_error_response = True
+    return resp
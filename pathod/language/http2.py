@@ -41,6 +41,8 @@ def get_header(val, headers):
 
 
 class _HeaderMixin:
+    __slots__ = ()
+
     @property
     def unique_name(self):
         return None
@@ -88,10 +90,11 @@ class _HTTP2Message(message.Message):
 
 
 class StatusCode(base.Integer):
-    pass
+    __slots__ = ()
 
 
 class Method(base.OptionsOrValue):
+    __slots__ = ()
     options = [
         "GET",
         "HEAD",
@@ -102,24 +105,28 @@ class Method(base.OptionsOrValue):
 
 
 class Path(base.Value):
-    pass
+    __slots__ = ()
 
 
 class Header(_HeaderMixin, base.KeyValue):
+    __slots__ = ()
     preamble = "h"
 
 
 class ShortcutContentType(_HeaderMixin, base.Value):
+    __slots__ = ()
     preamble = "c"
     key = base.TokValueLiteral("content-type")
 
 
 class ShortcutLocation(_HeaderMixin, base.Value):
+    __slots__ = ()
     preamble = "l"
     key = base.TokValueLiteral("location")
 
 
 class ShortcutUserAgent(_HeaderMixin, base.OptionsOrValue):
+    __slots__ = ()
     preamble = "u"
     options = [i[1] for i in user_agents.UASTRINGS]
     key = base.TokValueLiteral("user-agent")
@@ -136,14 +143,17 @@ class ShortcutUserAgent(_HeaderMixin, base.OptionsOrValue):
 
 
 class Raw(base.CaselessLiteral):
+    __slots__ = ()
     TOK = "r"
 
 
 class Body(base.Value):
+    __slots__ = ()
     preamble = "b"
 
 
 class Times(base.Integer):
+    __slots__ = ()
     preamble = "x"
 
 
@@ -209,6 +219,7 @@ class Response(_HTTP2Message):
 
 
 class NestedResponse(message.NestedMessage):
+    __slots__ = ()
     preamble = "s"
     nest_type = Response
 
@@ -303,4 +314,6 @@ def make_error_response(reason, body=None):
         StatusCode("800"),
         Body(base.TokValueLiteral("pathod error: " + (body or reason))),
     ]
-    return Response(tokens)
+    resp = Response(tokens)
+    resp.is_error_response = True
+    return resp
@@ -1,4 +1,5 @@
 import abc
+import functools
 import typing  # noqa
 
 import pyparsing as pp
@@ -9,13 +10,27 @@ from . import actions, exceptions, base
 LOG_TRUNCATE = 1024
 
 
+@functools.lru_cache()
+def grammar(klass):
+    """
+        The parse expression for a message class. Message grammars are
+        expensive to build, so each is built once and shared.
+    """
+    return klass.expr()
+
+
 class Message:
     __metaclass__ = abc.ABCMeta
     logattrs: typing.List[str] = []
 
     def __init__(self, tokens):
         track = set([])
+        # Index tokens by every class they are an instance of, so that tok()
+        # and toks() don't have to scan the token list.
+        by_type: typing.Dict[type, typing.List[base.Token]] = {}
         for i in tokens:
+            for klass in type(i).__mro__:
+                by_type.setdefault(klass, []).append(i)
             if i.unique_name:
                 if i.unique_name in track:
                     raise exceptions.ParseException(
@@ -26,6 +41,8 @@ class Message:
                 else:
                     track.add(i.unique_name)
         self.tokens = tokens
+        self._by_type = by_type
+        self._length = None
 
     def strike_token(self, name):
         toks = [i for i in self.tokens if i.unique_name != name]
@@ -35,13 +52,13 @@ class Message:
         """
             Fetch all tokens that are instances of klass
         """
-        return [i for i in self.tokens if isinstance(i, klass)]
+        return list(self._by_type.get(klass, ()))
 
     def tok(self, klass):
         """
             Fetch first token that is an instance of klass
         """
-        l = self.toks(klass)
+        l = self._by_type.get(klass)
         if l:
             return l[0]
 
@@ -50,7 +67,11 @@ class Message:
             Calculate the length of the base message without any applied
             actions.
         """
-        return sum(len(x) for x in self.values(settings))
+        # Every offset action resolved against this message asks for its
+        # length, so remember it for the settings it was computed with.
+        if self._length is None or self._length[0] is not settings:
+            self._length = (settings, sum(len(x) for x in self.values(settings)))
+        return self._length[1]
 
     def preview_safe(self):
         """
@@ -105,6 +126,7 @@ class NestedMessage(base.Token):
     """
         A nested message, as an escaped string with a preamble.
     """
+    __slots__ = ("value", "parsed")
     preamble = ""
     nest_type: typing.Optional[typing.Type[Message]] = None
 
@@ -113,7 +135,7 @@ class NestedMessage(base.Token):
         self.value = value
         try:
             self.parsed = self.nest_type(
-                self.nest_type.expr().parseString(
+                grammar(self.nest_type).parseString(
                     value.val.decode(),
                     parseAll=True
                 )
@@ -135,10 +157,20 @@ class NestedMessage(base.Token):
     def spec(self):
         return "%s%s" % (self.preamble, self.value.spec())
 
-    def freeze(self, settings):
-        f = self.parsed.freeze(settings).spec()
-        return self.__class__(
-            base.TokValueLiteral(
-                strutils.bytes_to_escaped_str(f.encode(), escape_single_quotes=True)
+    @classmethod
+    def _from_parsed(cls, parsed):
+        """
+            Construct from an already parsed message, without reparsing its
+            spec.
+        """
+        n = cls.__new__(cls)
+        n.value = base.TokValueLiteral(
+            strutils.bytes_to_escaped_str(
+                parsed.spec().encode(), escape_single_quotes=True
             )
         )
+        n.parsed = parsed
+        return n
+
+    def freeze(self, settings):
+        return self._from_parsed(self.parsed.freeze(settings))
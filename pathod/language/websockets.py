@@ -14,10 +14,12 @@ NESTED_LEADER = b"pathod!"
 
 
 class WF(base.CaselessLiteral):
+    __slots__ = ()
     TOK = "wf"
 
 
 class OpCode(base.IntField):
+    __slots__ = ()
     names: typing.Dict[str, int] = {
         "continue": Opcode.CONTINUATION,
         "text": Opcode.TEXT,
@@ -31,50 +33,61 @@ class OpCode(base.IntField):
 
 
 class Body(base.Value):
+    __slots__ = ()
     preamble = "b"
 
 
 class RawBody(base.Value):
+    __slots__ = ()
     unique_name = "body"
     preamble = "r"
 
 
 class Fin(base.Boolean):
+    __slots__ = ()
     name = "fin"
 
 
 class RSV1(base.Boolean):
+    __slots__ = ()
     name = "rsv1"
 
 
 class RSV2(base.Boolean):
+    __slots__ = ()
     name = "rsv2"
 
 
 class RSV3(base.Boolean):
+    __slots__ = ()
     name = "rsv3"
 
 
 class Mask(base.Boolean):
+    __slots__ = ()
     name = "mask"
 
 
 class Key(base.FixedLengthValue):
+    __slots__ = ()
     preamble = "k"
     length = 4
 
 
 class KeyNone(base.CaselessLiteral):
+    __slots__ = ()
     unique_name = "key"
     TOK = "knone"
 
 
 class Length(base.Integer):
+    __slots__ = ()
     bounds = (0, 1 << 64)
     preamble = "l"
 
 
 class Times(base.Integer):
+    __slots__ = ()
     preamble = "x"
 
 
@@ -193,10 +206,10 @@ class WebsocketFrame(message.Message):
     def values(self, settings):
         if self.body:
             bodygen = self.body.value.get_generator(settings)
-            length = len(self.body.value.get_generator(settings))
+            length = len(bodygen)
         elif self.rawbody:
             bodygen = self.rawbody.value.get_generator(settings)
-            length = len(self.rawbody.value.get_generator(settings))
+            length = len(bodygen)
         elif self.nested_frame:
             bodygen = NESTED_LEADER + strutils.always_bytes(self.nested_frame.parsed.spec())
             length = len(bodygen)
@@ -204,7 +217,7 @@ class WebsocketFrame(message.Message):
             bodygen = None
             length = 0
         if self.toklength:
-            length = int(self.toklength.value)
+            length = self.toklength.int_value
         frameparts = dict(
             payload_length=length
         )
@@ -247,6 +260,7 @@ class WebsocketFrame(message.Message):
 
 
 class NestedFrame(message.NestedMessage):
+    __slots__ = ()
     preamble = "f"
     nest_type = WebsocketFrame
 
@@ -1,5 +1,6 @@
 import time
 from mitmproxy import exceptions
+from . import generators
 
 BLOCKSIZE = 1024
 # It's not clear what the upper limit for time.sleep is. It's lower than the
@@ -11,13 +12,37 @@ def send_chunk(fp, val, blocksize, start, end):
     """
         (start, end): Inclusive lower bound, exclusive upper bound.
     """
-    for i in range(start, end, blocksize):
-        fp.write(
-            val[i:min(i + blocksize, end)]
-        )
+    if isinstance(val, generators.Generator):
+        for chunk in val.stream(start, end, blocksize):
+            fp.write(chunk)
+        return end - start
+    # Byte values are already in memory, so hand the whole range over in a
+    # single write instead of one write per block. The connection's write
+    # loops until everything has been sent.
+    fp.write(val[start:end])
     return end - start
 
 
+def coalesce_values(vals):
+    """
+        Join runs of adjacent byte strings in vals into a single value, leaving
+        generators in place so they can still be streamed.
+    """
+    ret = []
+    run = []
+    for v in vals:
+        if isinstance(v, bytes):
+            run.append(v)
+        else:
+            if run:
+                ret.append(b"".join(run))
+                run = []
+            ret.append(v)
+    if run:
+        ret.append(b"".join(run))
+    return ret
+
+
 def write_values(fp, vals, actions, sofar=0, blocksize=BLOCKSIZE):
     """
         vals: A list of values, which may be strings or Value objects.
@@ -25,17 +50,22 @@ def write_values(fp, vals, actions, sofar=0, blocksize=BLOCKSIZE):
         actions: A list of (offset, action, arg) tuples. Action may be "inject",
         "pause" or "disconnect".
 
-        Both vals and actions are in reverse order, with the first items last.
+        Both vals and actions are in order, with the first items first. Actions
+        must be sorted by offset.
 
         Return True if connection should disconnect.
     """
     sofar = 0
+    ai = 0
+    na = len(actions)
     try:
-        while vals:
-            v = vals.pop()
+        for v in vals:
+            # len() of a FileGenerator stats the file, so compute it once.
+            vlen = len(v)
             offset = 0
-            while actions and actions[-1][0] < (sofar + len(v)):
-                a = actions.pop()
+            while ai < na and actions[ai][0] < (sofar + vlen):
+                a = actions[ai]
+                ai += 1
                 offset += send_chunk(
                     fp,
                     v,
@@ -51,11 +81,10 @@ def write_values(fp, vals, actions, sofar=0, blocksize=BLOCKSIZE):
                     return True
                 elif a[1] == "inject":
                     send_chunk(fp, a[2], blocksize, 0, len(a[2]))
-            send_chunk(fp, v, blocksize, offset, len(v))
-            sofar += len(v)
+            send_chunk(fp, v, blocksize, offset, vlen)
+            sofar += vlen
         # Remainders
-        while actions:
-            a = actions.pop()
+        for a in actions[ai:]:
             if a[1] == "pause":
                 time.sleep(
                     FOREVER if a[2] == "f" else a[2]
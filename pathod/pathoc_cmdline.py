@@ -206,19 +206,19 @@ def args_pathoc(argv, stdout=sys.stdout, stderr=sys.stderr):
     if args.use_http2:
         args.ssl = True
 
-    reqs = []
+    specs = []
     for r in args.requests:
         r = os.path.expanduser(r)
         if os.path.isfile(r):
             with open(r) as f:
                 r = f.read()
-        try:
-            reqs.append(language.parse_pathoc(r, args.use_http2))
-        except language.ParseException as v:
-            print("Error parsing request spec: %s" % v.msg, file=stderr)
-            print(v.marked(), file=stderr)
-            sys.exit(1)
-    args.requests = reqs
+        specs.append(r)
+    try:
+        args.requests = language.parse_pathoc_many(specs, args.use_http2)
+    except language.ParseException as v:
+        print("Error parsing request spec: %s" % v.msg, file=stderr)
+        print(v.marked(), file=stderr)
+        sys.exit(1)
     return args
 
 
@@ -232,9 +232,7 @@ class PathodHandler(tcp.BaseHandler):
                 return nexthandler, retlog
 
     def make_http_error_response(self, reason, body=None):
-        resp = self.protocol.make_error_response(reason, body)
-        resp.is_error_response = True
-        return resp
+        return self.protocol.make_error_response(reason, body)
 
     def handle(self):
         self.settimeout(self.server.timeout)
@@ -0,0 +1,46 @@
+"""
+    Measure pathod/pathoc spec parsing throughput.
+
+        python ./pathod-parse-bm.py [--packrat]
+
+    --packrat enables pyparsing's packrat memoization before the grammars are
+    built, so the two modes can be compared.
+"""
+import argparse
+import timeit
+
+import pyparsing as pp
+
+SPECS = [
+    ("pathod", "200"),
+    ("pathod", "200:h'Content-Type'='text/plain':b@1k:ir,'x':da"),
+    ("pathod", "ws:h'foo'='bar'"),
+    ("pathoc", "get:/"),
+    ("pathoc", "get:/foo:h'a'='b':b@100:ir,'x':da"),
+    ("pathoc", "get:/:s'200:b@10'"),
+    ("pathoc", "wf:b'hello':mask"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packrat", action="store_true")
+    parser.add_argument("-n", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.packrat:
+        pp.ParserElement.enablePackrat()
+
+    from pathod import language
+    parsers = dict(
+        pathod=language.parse_pathod,
+        pathoc=language.parse_pathoc,
+    )
+    for kind, spec in SPECS:
+        fn = parsers[kind]
+        t = timeit.timeit(lambda: list(fn(spec)), number=args.n)
+        print("{:>8.1f} us  {}  {}".format(t / args.n * 1e6, kind, spec))
+
+
+if __name__ == "__main__":
+    main()
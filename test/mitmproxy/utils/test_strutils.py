@@ -48,6 +48,8 @@ def test_bytes_to_escaped_str():
     assert strutils.bytes_to_escaped_str(b'\xc3\xbc') == r"\xc3\xbc"
     assert strutils.bytes_to_escaped_str(b"'") == r"'"
     assert strutils.bytes_to_escaped_str(b'"') == r'"'
+    assert strutils.bytes_to_escaped_str(b"foo bar") == "foo bar"
+    assert strutils.bytes_to_escaped_str(b"") == ""
 
     assert strutils.bytes_to_escaped_str(b"'", escape_single_quotes=True) == r"\'"
     assert strutils.bytes_to_escaped_str(b'"', escape_single_quotes=True) == r'"'
@@ -71,6 +73,7 @@ def test_escaped_str_to_bytes():
     assert strutils.escaped_str_to_bytes(u"\\x08") == b"\b"
     assert strutils.escaped_str_to_bytes(u"&!?=\\\\)") == br"&!?=\)"
     assert strutils.escaped_str_to_bytes(u"\u00fc") == b'\xc3\xbc'
+    assert strutils.escaped_str_to_bytes("") == b""
 
     with pytest.raises(ValueError):
         strutils.escaped_str_to_bytes(b"very byte")
@@ -125,6 +125,15 @@ class Test_Action:
         ret = e.resolve({}, r)
         assert isinstance(ret.offset, int)
 
+        e = actions.PauseAt("a", 10)
+        ret = e.resolve({}, r)
+        assert ret.offset == r.length({}) + 1
+        assert ret.seconds == 10
+        assert e.offset == "a"
+
+        e = actions.InjectAt(3, "foo")
+        assert e.resolve({}, r) is e
+
     def test_repr(self):
         e = actions.DisconnectAt("r")
         assert repr(e)
@@ -100,6 +100,7 @@ class TestTokValueGenerate:
         assert v.datatype == "digits"
         g = v.get_generator({})
         assert g[:100]
+        assert v.get_generator({}) is g
 
         v = base.TokValue.parseString("@10,digits")[0]
         assert v.unit == "b"
@@ -151,6 +152,37 @@ class TestTokValueFile:
         with pytest.raises(Exception, match="outside"):
             v.get_generator(language.Settings(staticdir=str(tmpdir)))
 
+        v = base.TokValue.parseString("<'sub/./../path'")[0]
+        g = v.get_generator(language.Settings(staticdir=str(tmpdir)))
+        assert g.path == str(tmpdir.join("path"))
+        v = base.TokValue.parseString("<'sub/../../path'")[0]
+        with pytest.raises(Exception, match="outside"):
+            v.get_generator(language.Settings(staticdir=str(tmpdir)))
+
+    def test_relative_staticdir(self, tmpdir, monkeypatch):
+        tmpdir.join("a", "path").write(b"a", ensure=True)
+        tmpdir.join("b", "path").write(b"b", ensure=True)
+        v = base.TokValue.parseString("<path")[0]
+        settings = language.Settings(staticdir=".")
+        monkeypatch.chdir(str(tmpdir.join("a")))
+        assert v.get_generator(settings)[:] == b"a"
+        monkeypatch.chdir(str(tmpdir.join("b")))
+        assert v.get_generator(settings)[:] == b"b"
+
+    def test_access_control_sibling(self, tmpdir):
+        # A sibling directory sharing the static directory's name as a
+        # prefix is still outside of it.
+        tmpdir.join("static").ensure(dir=True)
+        tmpdir.join("static2", "path").write(b"x", ensure=True)
+        settings = language.Settings(staticdir=str(tmpdir.join("static")))
+        v = base.TokValue.parseString("<'../static2/path'")[0]
+        with pytest.raises(Exception, match="outside"):
+            v.get_generator(settings)
+
+        settings.staticdir = str(tmpdir.join("static")) + "/"
+        with pytest.raises(Exception, match="outside"):
+            v.get_generator(settings)
+
     def test_spec(self):
         v = base.TokValue.parseString("<'one two'")[0]
         v2 = base.TokValue.parseString(v.spec())[0]
@@ -10,6 +10,12 @@ def test_randomgenerator():
     assert len(g[1:10]) == 9
     assert len(g[:1000]) == 100
     assert len(g[1000:1001]) == 0
+    assert len(g[0:10:2]) == 5
+
+
+def test_randomgenerator_charset():
+    g = generators.RandomGenerator("digits", 1000)
+    assert set(g[:]) <= set(generators.DATATYPES["digits"])
 
 
 def test_filegenerator(tmpdir):
@@ -21,8 +27,15 @@ def test_filegenerator(tmpdir):
     assert g[2:7] == b"cdefg"
     assert len(g[1:10]) == 9
     assert len(g[26000:26001]) == 0
+    assert g[-3:] == b"xyz"
+    assert g[0:10:2] == b"acegi"
+    assert g[:] == b"abcdefghijklmnopqrstuvwxyz" * 1000
     assert repr(g)
 
+    f = tmpdir.join("empty")
+    f.write(b"")
+    assert generators.FileGenerator(str(f))[:] == b""
+
 
 def test_transform_generator():
     def trans(offset, data):
@@ -33,3 +46,26 @@ def test_transform_generator():
     assert t[0] == "a"
     assert t[:] == "a" * len(g)
     assert repr(t)
+
+
+def test_randomgenerator_stream():
+    g = generators.RandomGenerator("digits", 100)
+    chunks = list(g.stream(0, 1000, 30))
+    assert [len(i) for i in chunks] == [30, 30, 30, 10]
+    assert list(g.stream(10, 5, 30)) == []
+
+
+def test_generator_stream(tmpdir):
+    f = tmpdir.join("foo")
+    f.write(b"abcdefghijklmnopqrstuvwxyz")
+    g = generators.FileGenerator(str(f))
+    assert list(g.stream(2, 12, 4)) == [b"cdef", b"ghij", b"kl"]
+    assert list(g.stream(20, 40, 4)) == [b"uvwx", b"yz"]
+
+
+def test_rand_bytes():
+    for chars in list(generators.DATATYPES.values()) + [b"xyz"]:
+        v = generators.rand_bytes(chars, 1000)
+        assert len(v) == 1000
+        assert set(v) <= set(chars)
+    assert generators.rand_bytes(b"xyz", 0) == b""
@@ -15,6 +15,9 @@ def test_make_error_response():
     d = io.BytesIO()
     s = http.make_error_response("foo")
     language.serve(s, d, {})
+    assert http.make_error_response("foo") is s
+    assert http.make_error_response("foo", "bar") is not s
+    assert s.is_error_response
 
 
 class TestRequest:
@@ -36,6 +39,14 @@ class TestRequest:
         r = parse_request('GET:@1k')
         assert len(r.path.string()) == 1024
 
+    def test_parse_many(self):
+        r = language.parse_pathoc_many(["GET:/ PUT:/", "POST:/:x2"])
+        assert len(r) == 2
+        assert [i.method.string() for i in r[0]] == [b"GET", b"PUT"]
+        assert [i.method.string() for i in r[1]] == [b"POST", b"POST"]
+        with pytest.raises(language.ParseException):
+            language.parse_pathoc_many(["GET:/", "foo"])
+
     def test_multiple(self):
         r = list(language.parse_pathoc("GET:/ PUT:/"))
         assert r[0].method.string() == b"GET"
@@ -199,6 +210,21 @@ class TestResponse:
         testlen(language.parse_pathod("400:m'msg':h'foo'='bar':r"))
         testlen(language.parse_pathod("400:m'msg':h'foo'='bar':b@100b:r"))
 
+    def test_length_cached(self):
+        r = next(language.parse_pathod("400:b@100:dr:pa,0"))
+        settings = language.Settings()
+        calls = []
+        values = r.values
+
+        def counting_values(settings):
+            calls.append(settings)
+            return values(settings)
+        r.values = counting_values
+        assert r.length(settings) == r.length(settings)
+        assert len(calls) == 1
+        r.length(language.Settings())
+        assert len(calls) == 2
+
     def test_maximum_length(self):
         def testlen(x):
             x = next(x)
@@ -267,6 +293,12 @@ class TestResponse:
             r.resolve(language.Settings())
         res = r.resolve(language.Settings(websocket_key=b"foo"))
         assert res.status_code.string() == b"101"
+        assert http.get_header(b"Sec-WebSocket-Accept", res.headers)
+        assert http.server_handshake_tokens(b"foo") is http.server_handshake_tokens(b"foo")
+
+        r = next(language.parse_pathod("ws:h'Upgrade'='foo'"))
+        res = r.resolve(language.Settings(websocket_key=b"foo"))
+        assert http.get_header(b"Upgrade", res.headers).value.val == b"foo"
 
 
 def test_ctype_shortcut():
@@ -349,7 +381,16 @@ def test_nested_response_freeze():
     assert e.freeze({})
     assert e.values({})
 
+    f = http.NestedResponse(base.TokValueLiteral("200:b@10")).freeze({})
+    assert f.parsed.spec() == http.NestedResponse(f.value).parsed.spec()
+
 
 def test_unique_components():
     with pytest.raises(Exception, match="multiple body clauses"):
         language.parse_pathod("400:b@1:b@1")
+
+
+def test_tokens_have_no_dict():
+    r = next(language.parse_pathod("200:h'foo'='bar':c'text/plain':m'OK':b@10:ir,'x':da"))
+    for t in r.tokens:
+        assert not hasattr(t, "__dict__"), t
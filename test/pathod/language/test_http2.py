@@ -28,6 +28,7 @@ def test_make_error_response():
     d = io.BytesIO()
     s = http2.make_error_response("foo", "bar")
     language.serve(s, d, default_settings())
+    assert s.is_error_response
 
 
 class TestRequest:
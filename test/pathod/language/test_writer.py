@@ -1,6 +1,6 @@
 import io
 from pathod import language
-from pathod.language import writer
+from pathod.language import writer, generators
 
 
 def test_send_chunk():
@@ -16,6 +16,49 @@ def test_send_chunk():
                 assert s.getvalue() == v[start:end]
 
 
+def test_send_chunk_bytes_single_write():
+    class Writes(io.BytesIO):
+        def __init__(self):
+            super().__init__()
+            self.writes = 0
+
+        def write(self, v):
+            self.writes += 1
+            return super().write(v)
+
+    s = Writes()
+    writer.send_chunk(s, b"x" * 100, 7, 3, 90)
+    assert s.getvalue() == b"x" * 87
+    assert s.writes == 1
+
+
+def test_send_chunk_generator():
+    g = generators.RandomGenerator("digits", 100)
+    for bs in [1, 7, 100, 1000]:
+        s = io.BytesIO()
+        assert writer.send_chunk(s, g, bs, 10, 60) == 50
+        assert len(s.getvalue()) == 50
+
+
+def test_send_chunk_file(tmpdir):
+    f = tmpdir.join("foo")
+    f.write(b"abcdefghijklmnopqrstuvwxyz")
+    g = generators.FileGenerator(str(f))
+    for bs in range(1, 30):
+        s = io.BytesIO()
+        writer.send_chunk(s, g, bs, 3, 20)
+        assert s.getvalue() == b"defghijklmnopqrst"
+
+
+def test_coalesce_values():
+    g = generators.RandomGenerator("digits", 10)
+    assert writer.coalesce_values([]) == []
+    assert writer.coalesce_values([b"a", b"b"]) == [b"ab"]
+    assert writer.coalesce_values(
+        [b"a", b"b", g, b"c", g, g, b"d", b"e"]
+    ) == [b"ab", g, b"c", g, g, b"de"]
+
+
 def test_write_values_inject():
     tst = b"foo"
 
@@ -59,7 +102,7 @@ def test_write_values_pauses():
     for i in range(2, 10):
         s = io.BytesIO()
         writer.write_values(
-            s, [tst], [(2, "pause", 0), (1, "pause", 0)], blocksize=i
+            s, [tst], [(1, "pause", 0), (2, "pause", 0)], blocksize=i
         )
         assert s.getvalue() == tst
 
@@ -71,10 +114,20 @@ def test_write_values_pauses():
     tst = [tst] * 5
     for i in range(2, 10):
         s = io.BytesIO()
-        writer.write_values(s, tst[:], [(1, "pause", 0)], blocksize=i)
+        writer.write_values(s, tst, [(1, "pause", 0)], blocksize=i)
         assert s.getvalue() == b"".join(tst)
 
 
+def test_write_values_order():
+    s = io.BytesIO()
+    writer.write_values(
+        s,
+        [b"foo", b"bar"],
+        [(1, "inject", b"x"), (4, "inject", b"y"), (6, "inject", b"z")]
+    )
+    assert s.getvalue() == b"fxoobyarz"
+
+
 def test_write_values_after():
     s = io.BytesIO()
     r = next(language.parse_pathod("400:da"))